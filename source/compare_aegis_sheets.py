@@ -29,25 +29,45 @@ Notes:
   - The helper functions are small and documented, so pydoc can render useful help.
 """
 
-import math
 import argparse
 import csv
+import functools
 import logging
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
-from get_ena_checklist_details import ENASchemaStoreClient
+from get_ena_checklist_details import ENASchemaStoreClient, HTTP_POOL
 
 try:
     import pandas as pd  # optional
 except Exception:  # pragma: no cover
     pd = None
 
-import urllib.request
-
 logger = logging.getLogger("compare_aegis_sheets")
 
+# Columns actually consumed downstream (process() and write_draft_checklists());
+# projecting at parse time lets pandas skip materializing the free-text columns.
+ENA_SHEET_COLUMNS = frozenset({
+    'Confidence to add',
+    'Metadata Category',
+    'ENA recommended',
+    'field description(current or prospective)',
+    'Needs New Term in ENA',
+    'AEGIS term',
+    'Control',
+})
+CARL_SHEET_COLUMNS = frozenset({'ENA wish'})
+
+# Compiled once at import; these run on every sheet URL / sheet cell.
+_SHEET_ID_RE = re.compile(r"/spreadsheets/d/([\w-]+)")
+_GID_FRAG_RE = re.compile(r"gid=(\d+)")
+_NON_TERMS_RE = re.compile(r"^\s*(\?|TBD|N\.A\.|N\.A\.\?|eh\?|not_needed)\s*$", re.IGNORECASE)
+
+# String spellings treated as True in the sheets' yes/no style columns
+_TRUTHY = frozenset({"true", "t", "yes", "y", "1"})
+
 
 def credits():
     credit_str = ("This work is the combined effort of many people including: " +
@@ -65,9 +85,13 @@ def ena_checklist_programmatic_details():
               )
     return my_str
 
+@functools.lru_cache(maxsize = 8)
 def _extract_sheet_id_and_gid(url_or_id: str):
     """Extract identifiers from a Google Sheets URL or ID.
 
+    Memoized: main() parses each sheet argument once for validation and
+    again when fetching, so repeat calls are a cache hit.
+
     Parameters:
       url_or_id: str
         Either a full Google Sheets URL (with optional gid in query or fragment)
@@ -80,7 +104,7 @@ def _extract_sheet_id_and_gid(url_or_id: str):
     if url_or_id.startswith("http://") or url_or_id.startswith("https://"):
         parsed = urlparse(url_or_id)
         # Expected path like /spreadsheets/d/<ID>/edit
-        m = re.search(r"/spreadsheets/d/([\w-]+)", parsed.path)
+        m = _SHEET_ID_RE.search(parsed.path)
         sheet_id = m.group(1) if m else None
         qs = parse_qs(parsed.query)
         gid = None
@@ -88,7 +112,7 @@ def _extract_sheet_id_and_gid(url_or_id: str):
         if not gid and "gid" in qs:
             gid = qs.get("gid", [None])[0]
         if not gid and parsed.fragment:
-            m2 = re.search(r"gid=(\d+)", parsed.fragment)
+            m2 = _GID_FRAG_RE.search(parsed.fragment)
             gid = m2.group(1) if m2 else None
         return sheet_id, gid
     # Otherwise treat as an ID
@@ -135,30 +159,103 @@ def _fetch_csv_bytes(sheet_id: str, gid) -> bytes:
     url = _csv_export_url(sheet_id, gid)
     logger.info(f"Fetching CSV export: {url}")
     try:
-        with urllib.request.urlopen(url) as resp:
-            return resp.read()
+        # reuse the shared keep-alive pool rather than opening a fresh
+        # connection per sheet via urllib.request.urlopen
+        return HTTP_POOL.request("GET", url).data
     except Exception as e:  # pragma: no cover
         logger.error(f"Failed to fetch CSV export: {e}\n{essential_note}")
         raise
 
 
+def _open_csv_stream(sheet_id: str, gid):
+    """Open the CSV export as a streaming HTTP response.
+
+    Parameters:
+      sheet_id: str
+      gid: str | None
+
+    Returns:
+      urllib3.response.HTTPResponse: file-like response with the body not yet
+      read, suitable for passing straight to pandas.read_csv. The caller must
+      release the connection (release_conn) when done.
+    """
+    url = _csv_export_url(sheet_id, gid)
+    logger.info(f"Streaming CSV export: {url}")
+    try:
+        return HTTP_POOL.request("GET", url, preload_content = False)
+    except Exception as e:  # pragma: no cover
+        logger.error(f"Failed to open CSV export stream: {e}\n{essential_note}")
+        raise
+
+
 def _write_csv_bytes(path: str, content: bytes):
     os.makedirs(os.path.dirname(path), exist_ok = True)
-    with open(path, "wb") as f:
+    with open(path, "wb", buffering = 1 << 20) as f:
         f.write(content)
 
 
-def _load_with_pandas(csv_bytes: bytes):
-    """Load CSV bytes into a pandas DataFrame.
+def _cached_csv_path(sheet_id: str, gid, cache_dir: str, refresh: bool = False):
+    """Return the path of a local copy of the sheet CSV, downloading on miss.
+
+    Keyed by (sheet_id, gid) so iterative development runs skip the HTTP
+    fetch entirely when the sheet has already been pulled.
 
     Parameters:
-      csv_bytes: bytes
+      sheet_id: str
+      gid: str | None
+      cache_dir: str
+        Directory holding the cached exports (created on demand).
+      refresh: bool
+        Force a re-download even if a cached copy exists.
+
+    Returns:
+      str: path to the cached CSV file.
+    """
+    cache_path = os.path.join(cache_dir, f"{sheet_id}_{gid or 'default'}.csv")
+    if refresh or not os.path.exists(cache_path):
+        _write_csv_bytes(cache_path, _fetch_csv_bytes(sheet_id, gid))
+    else:
+        logger.info(f"Using cached CSV export: {cache_path}")
+    return cache_path
+
+
+def _load_with_pandas(sheet_id: str, gid, usecols = None, cache_dir = None, refresh = False):
+    """Load the sheet CSV into a pandas DataFrame.
+
+    With a cache_dir, reads from the local (sheet_id, gid)-keyed copy,
+    downloading only on a miss or when refresh is set. Without one, the
+    response body is streamed straight into the parser so the full CSV is
+    never buffered in memory a second time. Everything is read as plain
+    strings (dtype=str, na_filter=False): downstream only does string/set
+    work, so dtype inference and NA scanning are wasted passes.
+
+    Parameters:
+      sheet_id: str
+      gid: str | None
+      usecols: collection of column names | None
+        Restrict parsing to these columns. Passed as a membership callable so
+        a column missing from the live sheet is skipped rather than an error.
+      cache_dir: str | None
+        Directory for cached CSV exports; None disables the disk cache.
+      refresh: bool
+        Force a re-download even if a cached copy exists.
 
     Returns:
       pandas.DataFrame
     """
-    from io import BytesIO
-    return pd.read_csv(BytesIO(csv_bytes))
+    read_csv_kwargs = dict(
+        usecols = usecols.__contains__ if usecols is not None else None,
+        dtype = str,
+        na_filter = False,
+        engine = 'c',
+    )
+    if cache_dir:
+        return pd.read_csv(_cached_csv_path(sheet_id, gid, cache_dir, refresh), **read_csv_kwargs)
+    resp = _open_csv_stream(sheet_id, gid)
+    try:
+        return pd.read_csv(resp, **read_csv_kwargs)
+    finally:
+        resp.release_conn()
 
 
 def _load_with_csv_module(csv_bytes: bytes):
@@ -179,57 +276,56 @@ def _load_with_csv_module(csv_bytes: bytes):
     return header, data
 
 
-def clean_ena_field_list(field_list):
-    """Clean up a list of ENA recommended fields.
+def clean_ena_field_list(series):
+    """Clean up a Series of ENA recommended fields.
 
-    Ensures all inputs are treated as strings and trims content before a '+', if present.
-    Non-string values (e.g., None, NaN, numbers) are converted to strings; NaN/None become ''.
-    """
-    ena_ena_field_set = set()
-    non_terms_pattern = re.compile(r"^\s*(\?|TBD|N\.A\.|N\.A\.\?|eh\?|not_needed)\s*$", re.IGNORECASE)
-    for item in field_list:
-        # Normalise to string; handle pandas NaN/None as empty string
-        try:
+    Drops null/blank cells and placeholder non-terms (e.g. '?', 'TBD'), trims
+    content before a '+' if present, strips quotes and whitespace. Implemented
+    as a vectorized pandas pipeline so the per-cell work runs in C.
 
-            is_nan = isinstance(item, float) and math.isnan(item)
-        except Exception:
-            is_nan = False
-        if item is None or is_nan:
-            continue
-        elif non_terms_pattern.match(str(item)):
-            continue
-        else:
-            s = str(item)
-        if '+' in s:
-            ena_ena_field_set.add(s.split('+')[0].replace('"', '').strip())
-        else:
-            ena_ena_field_set.add(s.strip())
+    Parameters:
+      series: pandas.Series
+        A sheet column of field names (typically dtype=str).
 
-    return list(ena_ena_field_set)
+    Returns:
+      frozenset[str]: unique cleaned field names, interned so the repeated
+      set arithmetic downstream compares mostly by pointer.
+    """
+    s = series.dropna().astype(str)
+    s = s[~s.str.match(_NON_TERMS_RE)]
+    s = s.str.split('+', n = 1).str[0].str.replace('"', '', regex = False).str.strip()
+    # blank cells arrive as '' when loaded with na_filter=False
+    s = s[s != '']
+    return frozenset(sys.intern(x) for x in s.unique())
 
 
 def _is_truthy(v):
     """Helper function to determine if a value is truthy."""
     if isinstance(v, bool):
         return v is True
-    if v is None:
+    # Handle None and pandas NA/NaN
+    if v is None or (pd is not None and pd.isna(v)):
         return False
-    # Handle pandas NA/NaN
-    try:
-        import math
-        if isinstance(v, float) and math.isnan(v):
-            return False
-    except Exception:
-        pass
     # Numeric truthiness: 1 => True, 0 => False
-    if isinstance(v, (int,)):
+    if isinstance(v, int):
         return v == 1
-    # String truthiness
-    s = str(v).strip().lower()
-    return s in {"true", "t", "yes", "y", "1"}
+    # String truthiness; _TRUTHY is precomputed at module level
+    return str(v).strip().lower() in _TRUTHY
 
 
-def process(df_ena, df_carl):
+def _truthy_mask(series):
+    """Vectorized _is_truthy over a whole column.
+
+    Parameters:
+      series: pandas.Series
+
+    Returns:
+      pandas.Series of bool, True where the cell spells a truthy value.
+    """
+    return series.astype(str).str.strip().str.lower().isin(_TRUTHY)
+
+
+def process(df_ena, df_carl, ena_client):
     """Placeholder for downstream comparison logic.
 
     Parameters:
@@ -237,6 +333,9 @@ def process(df_ena, df_carl):
         DataFrame loaded from the AEGIS_plus_draft_checklist sheet, if pandas available.
       df_ena: pandas.DataFrame or None
         DataFrame loaded from the AEGIS_ENA_upload sheet, if pandas are available.
+      ena_client: ENASchemaStoreClient
+        Shared schema-store client, constructed once by the caller so its
+        connection pool and /fields cache live for the whole run.
 
     Notes:
       Currently this function only logs basic shape information if DataFrames are provided.
@@ -247,89 +346,95 @@ def process(df_ena, df_carl):
     else:
         logger.info("process(): pandas not available or DataFrames not created; skipping comparison stub.")
 
-    ena_client = ENASchemaStoreClient()
     # all_ena_fields = ena_client.list_field_names()
 
-    logger.debug(f"mandatory_ena_fields={ena_client.mandatory_ena_fields}")
     mandatory_ena_fields_set = set(ena_client.mandatory_ena_fields)
-    logger.debug(f"experiment_ena_fields_all={ena_client.experiment_ena_fields_all}")
     experiment_ena_fields_all_set = set(ena_client.experiment_ena_fields_all)
     experiment_ena_fields_mandatory_set = set(ena_client.experiment_ena_fields_mandatory)
-    logger.debug(f"experiment_ena_fields_mandatory={sorted(experiment_ena_fields_mandatory_set)}")
+    # Guard the debug dumps so the sorting/formatting work is skipped at INFO
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"mandatory_ena_fields={ena_client.mandatory_ena_fields}")
+        logger.debug(f"experiment_ena_fields_all={ena_client.experiment_ena_fields_all}")
+        logger.debug(f"experiment_ena_fields_mandatory={sorted(experiment_ena_fields_mandatory_set)}")
 
     # sys.exit(0)
 
-    logger.debug(f"df_carl.columns={df_carl.columns}")
-    carl_ena_field_list = clean_ena_field_list(df_carl['ENA wish'].tolist())
+    logger.debug("df_carl.columns=%s", df_carl.columns)
+    carl_ena_field_set = clean_ena_field_list(df_carl['ENA wish'])
 
     new_term_col_name = 'Needs New Term in ENA'
     # Log raw unique values to understand the data representation
-    try:
-        unique_vals = set(df_ena[new_term_col_name].tolist())
-    except Exception:
-        unique_vals = set()
-    logger.debug(f"ALL unique values for {new_term_col_name} {unique_vals}")
+    if logger.isEnabledFor(logging.DEBUG):
+        try:
+            unique_vals = set(df_ena[new_term_col_name].tolist())
+        except Exception:
+            unique_vals = set()
+        logger.debug(f"ALL unique values for {new_term_col_name} {unique_vals}")
 
     # Build a robust boolean mask handling different representations of truthy values
-
-    mask = df_ena[new_term_col_name].map(_is_truthy)
+    mask = _truthy_mask(df_ena[new_term_col_name])
     ena_ena_field_new_set = set(df_ena.loc[mask, 'ENA recommended'].tolist())
-    logger.debug(f"ena_ena_field_new_set: {sorted(ena_ena_field_new_set)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"ena_ena_field_new_set: {sorted(ena_ena_field_new_set)}")
 
-    logger.debug(f"df_ena.columns={df_ena.columns}")
-    ena_ena_field_list = clean_ena_field_list(df_ena['ENA recommended'].tolist())
-    carl_ena_field_set = set(carl_ena_field_list)
-    ena_ena_field_set = set(ena_ena_field_list)
+    logger.debug("df_ena.columns=%s", df_ena.columns)
+    ena_ena_field_set = clean_ena_field_list(df_ena['ENA recommended'])
 
     # remove any
     print(f"Carl's sheet total rows: {len(carl_ena_field_set)}")
     print(f"ENA's sheet total rows: {len(ena_ena_field_set)}")
 
-    logger.debug(f"carl_ena_field_set: {sorted(carl_ena_field_set)}")
-    tmp_news_terms = sorted(ena_ena_field_set.intersection(carl_ena_field_set))
-    logger.info(f"{len(tmp_news_terms)} common fields: {tmp_news_terms}")
+    # Derive each set relation exactly once; only sort at the point of logging
+    common_terms = carl_ena_field_set & ena_ena_field_set
+    carl_only = carl_ena_field_set - ena_ena_field_set
+    ena_only = ena_ena_field_set - carl_ena_field_set
+    carl_new_ena_terms = carl_ena_field_set & ena_ena_field_new_set
+    carl_only_non_experiment = carl_only - experiment_ena_fields_all_set
+    mandatory_missing = mandatory_ena_fields_set - ena_ena_field_set
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"carl_ena_field_set: {sorted(carl_ena_field_set)}")
+    logger.info(f"{len(common_terms)} common fields: {sorted(common_terms)}")
     # any designated new ENA terms on this?
-    tmp_news_terms = sorted(carl_ena_field_set.intersection(ena_ena_field_new_set))
-    logger.info(f"{len(tmp_news_terms)} new ENA terms on Carl's: {tmp_news_terms}")
-    carl_diff_terms = sorted(carl_ena_field_set.difference(ena_ena_field_set))
-    logger.info(f"{len(carl_diff_terms)} new terms on Carl's not on ENA: {carl_diff_terms}")
+    logger.info(f"{len(carl_new_ena_terms)} new ENA terms on Carl's: {sorted(carl_new_ena_terms)}")
+    logger.info(f"{len(carl_only)} new terms on Carl's not on ENA: {sorted(carl_only)}")
     print("\n")
 
-    logger.debug(f"ena_ena_field_set: {sorted(ena_ena_field_set)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"ena_ena_field_set: {sorted(ena_ena_field_set)}")
 
     print("\n")
     print(f"differences:")
-    tmp_diffs = set(sorted(carl_ena_field_set - ena_ena_field_set))
-    logger.info(f"carl_ena_field_set - ena_ena_field_set total={len(tmp_diffs)}: {tmp_diffs}")
+    logger.info(f"carl_ena_field_set - ena_ena_field_set total={len(carl_only)}: {carl_only}")
     logger.info(f"   and after removing the sequence_experiment terms total=")
-    logger.info(f"{len(tmp_diffs - experiment_ena_fields_all_set)}:")
-    logger.info(f"{tmp_diffs - experiment_ena_fields_all_set}:")
-    tmp_diffs = set(sorted(ena_ena_field_set - carl_ena_field_set))
-    logger.info(f"ena_ena_field_set - carl_ena_field_set total={len(tmp_diffs)}: {tmp_diffs}")
+    logger.info(f"{len(carl_only_non_experiment)}:")
+    logger.info(f"{carl_only_non_experiment}:")
+    logger.info(f"ena_ena_field_set - carl_ena_field_set total={len(ena_only)}: {ena_only}")
     print("\n")
 
-    logger.info(f"{len(mandatory_ena_fields_set) - len(mandatory_ena_fields_set - ena_ena_field_set)}/{len(mandatory_ena_fields_set)} ")
-    logger.info(f"mandatory fields in ENA, remaining: {sorted(mandatory_ena_fields_set - ena_ena_field_set)}")
+    logger.info(f"{len(mandatory_ena_fields_set) - len(mandatory_missing)}/{len(mandatory_ena_fields_set)} ")
+    logger.info(f"mandatory fields in ENA, remaining: {sorted(mandatory_missing)}")
 
 
 
 def write_df_to_md(df_sample_hc, out_file_path, output_fields):
-    """
+    """Write a DataFrame as a markdown table, streaming row by row.
+
+    Avoids DataFrame.to_markdown, which needs tabulate and builds the whole
+    column-width-padded table in memory before writing.
 
     :param df_sample_hc:
     :param out_file_path:
     :param output_fields:
     :return:
     """
-    with open(out_file_path, 'w') as out_file:
-        try:
-            df_sample_hc.to_markdown(out_file, index = False)
-        except Exception:
-            # Fallback to TSV if markdown export is unavailable
-            out_file.write("\t".join(output_fields) + "\n")
-            for _, row in df_sample_hc.iterrows():
-                out_file.write("\t".join(str(row[c]) if c in row else "" for c in output_fields) + "\n")
-    logger.debug(f"df_sample_hc head=\n{df_sample_hc.head(10)}")
+    with open(out_file_path, 'w', buffering = 1 << 20) as out_file:
+        out_file.write('| ' + ' | '.join(output_fields) + ' |\n')
+        out_file.write('|' + ' --- |' * len(output_fields) + '\n')
+        for row in df_sample_hc.itertuples(index = False):
+            out_file.write('| ' + ' | '.join(map(str, row)) + ' |\n')
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"df_sample_hc head=\n{df_sample_hc.head(10)}")
 
 def write_draft_checklists(df_ena, path):
     """Write the draft checklist files for ENA/AEGIS mapping.
@@ -353,7 +458,7 @@ def write_draft_checklists(df_ena, path):
         'AEGIS term',
     ]
 
-    logger.debug(f"df_ena.columns={list(df_ena.columns)}")
+    logger.debug("df_ena.columns=%s", df_ena.columns)
 
     missing = [c for c in required_cols if c not in df_ena.columns]
     if missing:
@@ -361,11 +466,12 @@ def write_draft_checklists(df_ena, path):
         return
 
     logger.info(f"write_draft_checklists(): writing draft checklist to {path}")
-    try:
-        logger.debug(f"df_ena.columns={list(df_ena.columns)}")
-        logger.debug(f"df_ena head=\n{df_ena.head()}")
-    except Exception:
-        pass
+    if logger.isEnabledFor(logging.DEBUG):
+        try:
+            logger.debug(f"df_ena.columns={list(df_ena.columns)}")
+            logger.debug(f"df_ena head=\n{df_ena.head()}")
+        except Exception:
+            pass
 
     output_fields = ['ENA recommended', 'field description(current or prospective)', 'Needs New Term in ENA',
                      'AEGIS term', 'Control']
@@ -398,7 +504,7 @@ def write_draft_checklists(df_ena, path):
     write_df_to_md(df_sample_ac, out_file_path, output_fields)
 
     # Generate a simple README with ENA terms that need adding
-    mask = df_ena['Needs New Term in ENA'].map(_is_truthy)
+    mask = _truthy_mask(df_ena['Needs New Term in ENA'])
     df_tmp = df_ena.loc[mask]
     logger.info(f"df_tmp.head=\n{df_tmp.head(10)}")
     ena_new_terms_list = sorted(df_tmp['ENA recommended'].dropna().astype(str).tolist())
@@ -441,6 +547,13 @@ def main():
         help = "URL or ID of second Google Sheet (AEGIS_ENA_upload)",
     )
     parser.add_argument("--print-head", type = int, default = 5, help = "Print first N rows for a quick preview")
+    parser.add_argument(
+        "--cache-dir",
+        default = os.path.join(os.path.dirname(__file__), "../data/cache/"),
+        help = "Directory for cached sheet CSV exports; pass an empty string to always fetch",
+    )
+    parser.add_argument("--refresh", action = "store_true",
+                        help = "Re-download the sheets even if cached copies exist")
     args = parser.parse_args()
 
     # Validate and parse sheet identifiers
@@ -451,37 +564,45 @@ def main():
             sys.exit(2)
         logger.info(f"Sheet {label}: id={sid} gid={gid}")
 
-    # Fetch CSV bytes
     sid_a, gid_a = _extract_sheet_id_and_gid(args.sheet_a)
     sid_b, gid_b = _extract_sheet_id_and_gid(args.sheet_b)
-    csv_a = _fetch_csv_bytes(sid_a, gid_a)
-    csv_b = _fetch_csv_bytes(sid_b, gid_b)
 
     df_a = None
     df_b = None
 
-    # Load for preview
-    if pd is not None:
-        try:
-            df_a = _load_with_pandas(csv_a)
-            df_b = _load_with_pandas(csv_b)
-            logger.info(f"Sheet A rows: {len(df_a)} cols: {len(df_a.columns)}")
-            logger.info(f"Sheet B rows: {len(df_b)} cols: {len(df_b.columns)}")
-            ph = max(0, args.print_head)
-            if ph:
-                print("\n=== Sheet A (head) ===")
-                print(df_a.head(ph))
-                print("\n=== Sheet B (head) ===")
-                print(df_b.head(ph))
-        except Exception as e:  # pragma: no cover
-            logger.warning(f"Pandas preview failed ({e}); falling back to csv module.")
-            pd_flag = False
-        else:
-            pd_flag = True
-    else:
-        pd_flag = False
+    # Load for preview; both sheets are network-bound so overlap the fetches.
+    # The pandas path streams download+parse and projects to the columns the
+    # pipeline consumes; the csv-module path only runs if pandas is missing.
+    pd_flag = pd is not None
+    if pd_flag:
+        with ThreadPoolExecutor(max_workers = 2) as executor:
+            future_a = executor.submit(_load_with_pandas, sid_a, gid_a, ENA_SHEET_COLUMNS,
+                                       args.cache_dir, args.refresh)
+            future_b = executor.submit(_load_with_pandas, sid_b, gid_b, CARL_SHEET_COLUMNS,
+                                       args.cache_dir, args.refresh)
+            df_a = future_a.result()
+            df_b = future_b.result()
+        logger.info(f"Sheet A rows: {len(df_a)} cols: {len(df_a.columns)}")
+        logger.info(f"Sheet B rows: {len(df_b)} cols: {len(df_b.columns)}")
+        ph = max(0, args.print_head)
+        if ph:
+            print("\n=== Sheet A (head) ===")
+            print(df_a.head(ph))
+            print("\n=== Sheet B (head) ===")
+            print(df_b.head(ph))
 
     if not pd_flag:
+        def fetch_bytes(sid, gid):
+            if args.cache_dir:
+                with open(_cached_csv_path(sid, gid, args.cache_dir, args.refresh), "rb") as f:
+                    return f.read()
+            return _fetch_csv_bytes(sid, gid)
+
+        with ThreadPoolExecutor(max_workers = 2) as executor:
+            future_a = executor.submit(fetch_bytes, sid_a, gid_a)
+            future_b = executor.submit(fetch_bytes, sid_b, gid_b)
+            csv_a = future_a.result()
+            csv_b = future_b.result()
         header_a, data_a = _load_with_csv_module(csv_a)
         header_b, data_b = _load_with_csv_module(csv_b)
         logger.info(f"Sheet A rows: {len(data_a)} cols: {len(header_a)}")
@@ -505,7 +626,8 @@ def main():
         write_draft_checklists(df_a, os.path.join(os.path.dirname(__file__), "../data/checklist/"))
     else:
         logger.info("Skipping draft checklist generation (pandas unavailable or ENA sheet not loaded).")
-    # process(df_a, df_b)
+    # ena_client = ENASchemaStoreClient()
+    # process(df_a, df_b, ena_client)
 
 
 if __name__ == "__main__":
@@ -16,24 +16,32 @@ import yaml
 import sys
 import json
 import re
+
+# Prefer the libyaml C loader; ~3-10x faster than the pure-Python SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 MIXS_term_regex = re.compile('^MIXS:[0-9]')
 MIXS_term9_regex = re.compile('^MIXS:9')
 
 class slot_info:
     def __init__(self, slot_name, slot_info):
         #print(f"inside slot_info for {slot_name}")
-        slot_info["slot_name"] = slot_name
+        # keep the name on the object rather than mutating the shared YAML dict
+        self.slot_name = slot_name
         self.slot_info = slot_info
         self.slot_uri = slot_info["slot_uri"]
-        logger.debug(f"slot_uri={self.slot_uri}")
+        logger.debug("slot_uri=%s", self.slot_uri)
+        self.slot_type = self._classify(self.slot_uri)
 
-        if re.match(MIXS_term_regex, self.slot_uri):
-            self.slot_type = "term"
-        else:
-            self.slot_type = "collection"
+    @staticmethod
+    def _classify(slot_uri):
+        """Classify a slot_uri as 'term' (MIXS:<digit>...) or 'collection'."""
+        if slot_uri.startswith("MIXS:") and slot_uri[5:6].isdigit():
+            return "term"
+        return "collection"
 
     def print_all(self):
-        print(json.dumps(self.slot_info, indent=4))
+        print(json.dumps({**self.slot_info, "slot_name": self.slot_name}, indent=4))
 
 class schema_class:
     def __init__(self, class_):
@@ -43,8 +51,11 @@ class schema_class:
 
 
 class Linkml_instance:
+    # the only top-level sections this class reads
+    WANTED_KEYS = frozenset({"name", "description", "slots"})
+
     def __init__(self, file_path):
-        self.data = load_linkml_yaml(file_path)
+        self.data = load_linkml_yaml(file_path, keys = self.WANTED_KEYS)
         if not self.data:
             print("No data to parse.")
             return
@@ -55,6 +66,9 @@ class Linkml_instance:
         self.schema_description = self.data.get("description", "N/A")
         logger.info(f"schema_description: {self.schema_description}")
 
+        # slot_info objects built once by print_term_slots and reused after
+        self._slot_objs = {}
+
         self.print_term_slots()
         sys.exit("FFFFFFFF")
 
@@ -69,20 +83,20 @@ class Linkml_instance:
         logger.info(f"term_slots")
         out_file = "../data/output/term_slots.txt"
 
-        outfile = open(out_file, "w")
         as_mixs_terms = set()
         as_mixs_terms9 = set()
         as_mixs_collections = set()
-        for slot_name in self.data["slots"]:
-
-            slot_obj = slot_info(slot_name, self.data["slots"][slot_name])
-            logger.debug(f"slot_name: {slot_name} slot_type: {slot_obj.slot_type}")
+        # single pass: construct each slot_info once and cache for later use
+        for slot_name, slot_details in self.data["slots"].items():
+            slot_obj = slot_info(slot_name, slot_details)
+            self._slot_objs[slot_name] = slot_obj
+            logger.debug("slot_name: %s slot_type: %s", slot_name, slot_obj.slot_type)
             if slot_obj.slot_type == "term":
                 as_mixs_terms.add(slot_name)
                 # slot_obj.print_all()
                 # sys.exit(0)
 
-                if re.match(MIXS_term9_regex, slot_obj.slot_uri):
+                if slot_obj.slot_uri.startswith("MIXS:9"):
                     as_mixs_terms9.add(slot_name)
 
             else:
@@ -94,25 +108,20 @@ class Linkml_instance:
         logger.info(f"as_mixs_collections={sorted(as_mixs_collections)}")
 
         logger.info(f"out_file: {out_file}")
-        outfile.write('\n'.join(sorted(as_mixs_terms)))
-        outfile.close()
+        # stream one name per line rather than joining a giant string in RAM
+        with open(out_file, "w", buffering = 1 << 16) as outfile:
+            for slot_name in sorted(as_mixs_terms):
+                outfile.write(slot_name)
+                outfile.write('\n')
         sys.exit("RRRRRRRR")
 
 
     def print_slot_objs(self):
-        logger.debug("inside create_slot_objs")
+        logger.debug("inside print_slot_objs")
 
-        # print(self.data["slots"])
-        for slot_name in self.data["slots"]:
-            logger.debug(f"slot_name: {slot_name}")
-            slot_obj = slot_info(slot_name, self.data["slots"][slot_name])
-
-
-
-            continue
-            slot_obj = slot_info(slot_name, self.data["slots"][slot_name])
-            slot_obj.print_all()
-            sys.exit()
+        # reuse the slot_info objects built by print_term_slots
+        for slot_name, slot_obj in self._slot_objs.items():
+            logger.debug("slot_name: %s slot_type: %s", slot_name, slot_obj.slot_type)
 
         sys.exit()
 
@@ -139,16 +148,33 @@ class Linkml_instance:
 
 
 
-def load_linkml_yaml(file_path):
+def load_linkml_yaml(file_path, keys = None):
     """
     Load and parse a LinkML YAML file.
     :param file_path: Path to the YAML file.
+    :param keys: Optional set of top-level keys to construct; any other
+        top-level section (classes, enums, imports, ...) is skipped, which
+        saves the bulk of the allocation for large schemas like mixs.yaml.
     :return: Parsed YAML content as a dictionary.
     """
     try:
         with open(file_path, 'r', encoding = 'utf-8') as file:
-            data = yaml.safe_load(file)
-        return data
+            if keys is None:
+                return yaml.load(file, Loader = _YAML_LOADER)
+            loader = _YAML_LOADER(file)
+            try:
+                node = loader.get_single_node()
+                if node is None or not isinstance(node, yaml.MappingNode):
+                    return None
+                # only build Python objects for the subtrees we actually use
+                data = {}
+                for key_node, value_node in node.value:
+                    key = loader.construct_object(key_node)
+                    if key in keys:
+                        data[key] = loader.construct_object(value_node, deep = True)
+                return data
+            finally:
+                loader.dispose()
     except Exception as e:
         print(f"Error loading YAML file: {e}")
         return None
@@ -15,13 +15,22 @@ Start date: 2025-09-10
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+import urllib3
 
 logger = logging.getLogger(__name__)
 
+# Shared connection pool: keep-alive avoids a fresh TCP+TLS handshake per
+# request, and gzip/deflate shrinks the JSON/CSV payloads on the wire.
+HTTP_POOL = urllib3.PoolManager(
+    maxsize = 8,
+    retries = urllib3.Retry(total = 3, backoff_factor = 0.3),
+    headers = {"Accept-Encoding": "gzip, deflate"},
+)
+
 
 class ENASchemaStoreClient:
     """Client for the EBI BioSamples Schema Store v2 API.
@@ -31,10 +40,15 @@ class ENASchemaStoreClient:
     - Schemas: https://www.ebi.ac.uk/biosamples/schema-store/api/v2/schemas/list
     """
 
-    def __init__(self, session: Optional[requests.Session] = None, timeout: int = 30):
+    def __init__(self, http: Optional[urllib3.PoolManager] = None, timeout: int = 30):
         self.base_url = "https://www.ebi.ac.uk/biosamples/schema-store/api/v2"
-        self.session = session or requests.Session()
+        self.http = http or HTTP_POOL
         self.timeout = timeout
+        # Cache parsed JSON per (path, params) so repeated lookups (e.g. the
+        # /fields payload used by both list_field_names and
+        # get_latest_field_details) cost one HTTP round-trip per run.
+        self._cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Dict[str, Any]] = {}
+        self._field_names_cache: Dict[int, List[str]] = {}
 
         self.mandatory_ena_fields = sorted(
             ['tax_id', 'collection date', 'sample_alias', 'sample_description', 'sample_title', 'scientific_name',
@@ -46,12 +60,20 @@ class ENASchemaStoreClient:
     # ----------------------------
     # Internal helpers
     # ----------------------------
-    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None,
+             refresh: bool = False) -> Dict[str, Any]:
+        cache_key = (path, tuple(sorted((params or {}).items())))
+        if not refresh and cache_key in self._cache:
+            logger.debug(f"cache hit for {path} params={params}")
+            return self._cache[cache_key]
         url = f"{self.base_url}{path}"
         logger.debug(f"GET {url} params={params}")
-        resp = self.session.get(url, params=params, timeout=self.timeout)
-        resp.raise_for_status()
-        return resp.json()
+        resp = self.http.request("GET", url, fields=params, timeout=self.timeout)
+        if resp.status >= 400:
+            raise urllib3.exceptions.HTTPError(f"GET {url} returned HTTP {resp.status}")
+        data = json.loads(resp.data)
+        self._cache[cache_key] = data
+        return data
 
     # ----------------------------
     # 1) List field names (labels)
@@ -61,12 +83,17 @@ class ENASchemaStoreClient:
 
         Mirrors: curl -s '<...>/fields?size=1000' | jq '._embedded.fields[].label' | sort
         """
+        if size in self._field_names_cache:
+            return self._field_names_cache[size]
         # The API may paginate; use size parameter as per the user example.
         data = self._get("/fields", params={"size": size})
         fields = data.get("_embedded", {}).get("fields", [])
         labels = [f.get("label") for f in fields if f.get("label")]
-        # Sort case-insensitively but keep original case
-        return sorted(labels, key=lambda s: s.lower())
+        # Sort case-insensitively but keep original case; str.casefold is a
+        # C-level key function, cheaper than a per-compare lambda
+        labels.sort(key=str.casefold)
+        self._field_names_cache[size] = labels
+        return labels
 
     # -------------------------------------------------
     # 2) Latest instance of a given field by its label
@@ -85,14 +112,14 @@ class ENASchemaStoreClient:
         if not matched:
             return None
 
-        # Sort by lastModifiedDate descending; fall back to version if missing
+        # Pick the entry with the newest lastModifiedDate; fall back to version
         def sort_key(f: Dict[str, Any]):
             # lastModifiedDate examples are ISO strings; safe for lexicographic sort
             # If missing, use empty string to sort last
             return (f.get("lastModifiedDate") or "", f.get("version") or -1)
 
-        matched.sort(key=sort_key, reverse=True)
-        return matched[0]
+        # only the most recent entry is wanted, so max() (O(N)) beats a full sort
+        return max(matched, key=sort_key)
 
     # ---------------------------------------------
     # 3) List schemas (id, accession, name) triplet
@@ -18,10 +18,91 @@ import logging
 logger = logging.getLogger(__name__)
 import argparse
 import json
+import os
+import pickle
 import yaml
-import re
 import sys
 
+# Parsed YAML cache keyed by (path, mtime): mixs.yaml is static per process,
+# so repeat MIxsFull constructions skip the file read and parse entirely.
+_YAML_CACHE = {}
+
+
+def _load_mixs(path):
+    """Load (or reuse) the parsed MIxS YAML for the given path."""
+    key = (path, os.path.getmtime(path))
+    if key not in _YAML_CACHE:
+        _YAML_CACHE[key] = _parse_mixs(path)
+    return _YAML_CACHE[key]
+
+
+def _parse_mixs(path):
+    """Parse the MIxS YAML file, via a pickle sidecar when it is fresh.
+
+    pickle.load on the already-parsed dict is an order of magnitude faster
+    than even the C YAML parser, so CLI runs after the first skip the parse.
+    A stale or unreadable sidecar falls back to a full parse and is rewritten.
+    """
+    pkl = path + '.pkl'
+    try:
+        if os.path.getmtime(pkl) >= os.path.getmtime(path):
+            with open(pkl, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # read the raw bytes in one go: libyaml scans UTF-8 itself, so this skips
+    # Python-level text decoding and the loader's incremental read chunking
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = yaml.load(raw, Loader = Loader)
+
+    try:
+        with open(pkl, 'wb') as f:
+            pickle.dump(data, f, protocol = pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.debug("could not write pickle sidecar %s: %s", pkl, e)
+    return data
+
+# top-level scalar fields that make up the schema header
+_HEADER_FIELDS = ('name', 'description', 'id', 'version')
+
+
+def _load_header(path):
+    """Read just the top-level scalar header fields from a MIxS YAML file.
+
+    Scans the parser event stream and stops as soon as every header field
+    has been seen, so deciding e.g. whether the right version is on disk
+    costs a few KB of parsing instead of the whole multi-MB document.
+
+    Returns:
+        dict: the found subset of name/description/id/version.
+    """
+    Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    header = {}
+    depth = 0
+    pending_key = None
+    with open(path, 'r') as f:
+        for event in yaml.parse(f, Loader = Loader):
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                depth += 1
+                if depth == 2 and pending_key is not None:
+                    pending_key = None  # value is a nested collection, not header material
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+            elif isinstance(event, yaml.ScalarEvent) and depth == 1:
+                if pending_key is None:
+                    pending_key = event.value
+                else:
+                    if pending_key in _HEADER_FIELDS:
+                        header[pending_key] = event.value
+                    pending_key = None
+            if len(header) == len(_HEADER_FIELDS):
+                break
+    return header
+
+
 class MIxsFull:
     """Class for parsing and accessing MIxS YAML specification data.
     
@@ -29,7 +110,16 @@ class MIxsFull:
     including slots, classes, field names, titles, and other metadata. It creates
     various indexes and lookup structures for efficient access to the MIxS data.
     """
-    
+
+    # fixed attribute layout: no per-instance __dict__, smaller instances and
+    # faster attribute access; the _-prefixed pair backs the lazy field lists
+    __slots__ = ('source_file', 'mixs_yaml', 'slots', 'classes', 'subsets',
+                 'name', 'description', 'comments', 'id', 'version',
+                 '_all_keys_main_slot_info', '_slot_hash_by_title',
+                 '_slot_hash_by_mixs_id', '_slot_name_by_title',
+                 '_all_field_names', '_all_field_titles')
+
+
     def __init__(self):
         """Initialise the MIxsFull object by loading and parsing the MIxS YAML file.
         
@@ -38,8 +128,7 @@ class MIxsFull:
         """
         self.source_file = 'mixs.yaml'
 
-        with open(self.source_file, 'r') as f:
-            self.mixs_yaml = yaml.safe_load(f)
+        self.mixs_yaml = _load_mixs(self.source_file)
 
         self.slots = self.mixs_yaml['slots']
         self.classes = self.mixs_yaml['classes']
@@ -51,71 +140,162 @@ class MIxsFull:
         self.id = self.mixs_yaml['id']
         self.version = self.mixs_yaml['version']
 
-        # intialises empty data structures
-        self.all_field_names = []
-        self.all_field_titles = []
-        self.get_all_field_names()
-        self.get_all_field_titles()
-        self.slot_hash_by_title = {}
-        self.slot_hash_by_mixs_id= {}
-        self.populate_all_keys_slot_info()
+        # index structures are built lazily (fused, on first access) so a
+        # caller that never touches them does not pay for the build
+        self._all_keys_main_slot_info = None
+        self._slot_hash_by_title = None
+        self._slot_hash_by_mixs_id = None
+        self._slot_name_by_title = None
+        self._all_field_names = None
+        self._all_field_titles = None
+
+    @classmethod
+    def header_only(cls, path = 'mixs.yaml'):
+        """Build a metadata-only stub without parsing the whole YAML file.
+
+        Useful when a caller only needs name/id/version/description (e.g. to
+        check which specification version is on disk) and wants to skip the
+        full parse and slot indexing.
+
+        Returns:
+            MIxsFull: a stub with only the header attributes populated.
+        """
+        obj = cls.__new__(cls)
+        obj.source_file = path
+        header = _load_header(path)
+        obj.name = header.get('name')
+        obj.description = header.get('description')
+        obj.id = header.get('id')
+        obj.version = header.get('version')
+        return obj
 
     def get_all_keys_slot_info(self):
         """Get all keys and their main slot information.
-        
+
         Returns:
-            list: A list of lists, each containing [key, title, description] for each slot.
+            list: A list of tuples, each containing (key, title, description) for each slot.
         """
         return self.all_keys_main_slot_info
 
-    def populate_all_keys_slot_info(self):
-        """Populate data structures with slot information.
-        
-        Creates a list of all keys with their titles and descriptions.
-        Also populates lookup dictionaries by title and MIxS ID.
+    def _ensure_indexes(self):
+        """Run the fused index build once, on first access to any index."""
+        if self._all_keys_main_slot_info is None:
+            self._build_indexes()
+
+    @property
+    def all_keys_main_slot_info(self):
+        """(key, title, description) tuples for every slot, built lazily."""
+        self._ensure_indexes()
+        return self._all_keys_main_slot_info
+
+    @property
+    def slot_hash_by_title(self):
+        """Slot dicts keyed by title, built lazily."""
+        self._ensure_indexes()
+        return self._slot_hash_by_title
+
+    @property
+    def slot_hash_by_mixs_id(self):
+        """Slot dicts keyed by MIxS ID, built lazily."""
+        self._ensure_indexes()
+        return self._slot_hash_by_mixs_id
+
+    @property
+    def slot_name_by_title(self):
+        """Slot names keyed by title, built lazily."""
+        self._ensure_indexes()
+        return self._slot_name_by_title
+
+    def _build_indexes(self):
+        """Build every slot-derived index in a single pass over self.slots.
+
+        Creates the list of (key, title, description) tuples and the lookup
+        dictionaries by title and MIxS ID; the field name/title lists (which
+        exclude keys ending with '_data') are lazy property projections.
+        """
+        # comprehensions let CPython presize each container and run the
+        # inserts at C speed instead of one interpreted store per slot.
+        # Keys and titles are short identifier-like strings stored in several
+        # structures at once, so intern them: one shared object each, cached
+        # hash, pointer-compare equality. Descriptions are long and unique,
+        # so interning them would only bloat the intern table.
+        items = [(sys.intern(key), sys.intern(value.get('title', '') or ''), value)
+                 for key, value in self.slots.items()]
+        # tuples: smaller and faster to allocate than 3-element lists,
+        # and consumers only ever index into the record
+        self._all_keys_main_slot_info = [(key, title, value.get('description', ''))
+                                         for key, title, value in items]
+        # keep the slot dicts read-only (they are shared with the module
+        # YAML cache); the key lives in a parallel map instead
+        self._slot_hash_by_title = {title: value for _, title, value in items}
+        self._slot_name_by_title = {title: key for key, title, _ in items}
+        # one .get() probe per slot instead of a membership test plus subscript
+        self._slot_hash_by_mixs_id = {mixs_id: value for _, _, value in items
+                                      if (mixs_id := value.get('mixs_id')) is not None}
+
+    def _build_field_lists(self):
+        """Build the field name and title lists in one pass.
+
+        Bulk-allocate then fill: [None] * n sizes each list once up
+        front, so the loop does plain index stores instead of append()
+        calls with their geometric reallocations, and the unused tail
+        is trimmed at the end.
         """
-        # Iterate and filter
-        self.all_keys_main_slot_info = []
-        for key, value in self.slots.items():
-                title = value.get('title', '')
-                description = value.get('description', '')
-                self.all_keys_main_slot_info.append([key, title, description])
-                self.slot_hash_by_title[title] = value
-                self.slot_hash_by_title[title]['name'] = key
-                #logger.debug(f"slot_hash_by_title[{title}]={value}")
-                if 'mixs_id' in value:
-                    self.slot_hash_by_mixs_id[value['mixs_id']] = value
-                    #logger.debug(f"slot_hash_by_mixs_id[{value['mixs_id']}]={value}")
+        records = self.all_keys_main_slot_info
+        n = len(records)
+        names = [None] * n
+        titles = [None] * n
+        j = 0
+        for key, title, _ in records:
+            if not key.endswith('_data'):
+                names[j] = key
+                titles[j] = title
+                j += 1
+        del names[j:]
+        del titles[j:]
+        self._all_field_names = names
+        self._all_field_titles = titles
 
+    def _ensure_field_lists(self):
+        """Build the field lists once, whichever getter is called first.
+
+        Both lists come out of the same _build_field_lists pass, so one
+        guard covers them: checking names alone is enough, and neither
+        getter can trigger a re-scan after the other has run.
+        """
+        if self._all_field_names is None:
+            self._build_field_lists()
+
+    @property
+    def all_field_names(self):
+        """Field names (excluding '_data' keys), computed on first access.
+
+        Hand-rolled lazy caching into a slot: cached_property needs a
+        per-instance __dict__, which __slots__ deliberately removes.
+        """
+        self._ensure_field_lists()
+        return self._all_field_names
+
+    @property
+    def all_field_titles(self):
+        """Field titles (excluding '_data' keys), computed on first access."""
+        self._ensure_field_lists()
+        return self._all_field_titles
 
     def get_all_field_names(self):
         """Get all field names from the MIxS specification.
-        
+
         Returns:
             list: A list of all field names, excluding those ending with '_data'.
         """
-        if len(self.all_field_names) > 0:
-            return self.all_field_names
-        result = []
-
-        for key, value in self.slots.items():
-            if not re.search(r'_data$', key):  # skip keys ending in "_data"
-                title = value.get('title', '')
-                description = value.get('description', '')
-                result.append([key, title, description])
-                self.all_field_titles.append(title)
-                self.all_field_names.append(key)
         return self.all_field_names
 
     def get_all_field_titles(self):
         """Get all field titles from the MIxS specification.
-        
+
         Returns:
             list: A list of all field titles.
         """
-        if len(self.all_field_titles) > 0:
-            return self.all_field_titles
-        self.get_all_field_names()
         return self.all_field_titles
 
     def print_mixs_obj_overview(self):
@@ -128,27 +308,29 @@ class MIxsFull:
 
         example_size = 3
 
-        print(f"name {self.name}")
-        print(f"id={self.id}")
-        print(f"version={self.version}")
-        print(f"description={self.description}")
-        print(f"comments={self.comments}")
-
-        print()
-        print(f"slots len={len(self.slots)} ")
-        print(f"classes len={len(self.classes)}")
-        print(f"subsets len={len(self.subsets)} all={self.subsets}")
-        print()
-        print(f"slot_hash_by_title total={len(self.slot_hash_by_title)}")
-        print(f"slot_hash_by_mixs_id total={len(self.slot_hash_by_mixs_id)}")
-        print(f"all_keys_main_slot_info total={len(self.all_keys_main_slot_info)}")
-        print()
-        print(f"all_field_names total={len(self.all_field_names)} first {example_size}={self.get_all_field_names()[0:example_size]}")
-        print(f"all_field_titles total={len(self.all_field_titles)} first {example_size}={self.get_all_field_titles()[0:example_size]}")
-
+        # assemble once and write in one go: ~15 separate print() calls each
+        # pay a stdout lock/flush cycle
+        parts = [
+            f"name {self.name}",
+            f"id={self.id}",
+            f"version={self.version}",
+            f"description={self.description}",
+            f"comments={self.comments}",
+            "",
+            f"slots len={len(self.slots)} ",
+            f"classes len={len(self.classes)}",
+            f"subsets len={len(self.subsets)} all={self.subsets}",
+            "",
+            f"slot_hash_by_title total={len(self.slot_hash_by_title)}",
+            f"slot_hash_by_mixs_id total={len(self.slot_hash_by_mixs_id)}",
+            f"all_keys_main_slot_info total={len(self.all_keys_main_slot_info)}",
+            "",
+            f"all_field_names total={len(self.all_field_names)} first {example_size}={self.get_all_field_names()[0:example_size]}",
+            f"all_field_titles total={len(self.all_field_titles)} first {example_size}={self.get_all_field_titles()[0:example_size]}",
+        ]
+        sys.stdout.write("\n".join(parts) + "\n")
 
         # print(f"MIxs_obj.mixs_yaml={self.mixs_yaml}")
-        example_size = 3
 
 
 
@@ -18,6 +18,9 @@ from urllib.request import urlopen
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C loader; ~3-10x faster than the pure-Python SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 @dataclass
 class LinkMLSchema:
     data: dict[str, Any]
@@ -26,14 +29,14 @@ class LinkMLSchema:
     def from_file(cls, file_path: str | Path) -> "LinkMLSchema":
         path = Path(file_path)
         with path.open("r", encoding="utf-8") as file:
-            data = yaml.safe_load(file) or {}
+            data = yaml.load(file, Loader=_YAML_LOADER) or {}
         return cls(data)
 
     @classmethod
     def from_url(cls, url: str) -> "LinkMLSchema":
         with urlopen(url) as response:
             content = response.read().decode("utf-8")
-        data = yaml.safe_load(content) or {}
+        data = yaml.load(content, Loader=_YAML_LOADER) or {}
         return cls(data)
 
     def get_raw_data(self) -> dict[str, Any]: